@@ -107,9 +107,19 @@ CREATE TABLE IF NOT EXISTS scoring_plays (
     description TEXT, saints_score INT, opp_score INT
 );
 
+-- HTTP validators for season list pages, used for conditional re-fetches
+CREATE TABLE IF NOT EXISTS page_validators (
+    url             TEXT PRIMARY KEY,
+    etag            TEXT,
+    last_modified   TEXT
+);
+
 CREATE INDEX IF NOT EXISTS idx_games_season ON games(season);
 CREATE INDEX IF NOT EXISTS idx_games_date ON games(game_date);
 CREATE INDEX IF NOT EXISTS idx_scoring_game ON scoring_plays(game_id);
+CREATE INDEX IF NOT EXISTS idx_passing_team ON player_passing(team);
+CREATE INDEX IF NOT EXISTS idx_rushing_team ON player_rushing(team);
+CREATE INDEX IF NOT EXISTS idx_receiving_team ON player_receiving(team);
 """
 
 # Column lists for each stat table (used for inserts)
@@ -157,11 +167,64 @@ STAT_TABLE_COLS = {
     ],
 }
 
+# Prepared INSERT statement per stat table, built once
+INSERT_SQL = {
+    table: (
+        f"INSERT OR REPLACE INTO {table} ({', '.join(cols)}) "
+        f"VALUES ({', '.join('?' for _ in cols)})"
+    )
+    for table, cols in STAT_TABLE_COLS.items()
+}
+
+UPSERT_PLAYER_SQL = (
+    "INSERT OR IGNORE INTO players (player_id, player_name, pfa_url) VALUES (?, ?, ?)"
+)
+
+INSERT_SCORING_PLAY_SQL = (
+    "INSERT INTO scoring_plays (game_id, quarter, team, description, saints_score, opp_score) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+
+# team_game_stats column -> (player stat table, column summed into it)
+TEAM_TOTAL_SOURCES = {
+    "rush_att": ("player_rushing", "att"),
+    "rush_yds": ("player_rushing", "yds"),
+    "rush_td": ("player_rushing", "td"),
+    "pass_att": ("player_passing", "att"),
+    "pass_com": ("player_passing", "com"),
+    "pass_yds": ("player_passing", "yds"),
+    "pass_td": ("player_passing", "td"),
+    "pass_int": ("player_passing", "int_thrown"),
+    "times_sacked": ("player_passing", "sacked"),
+    "sack_yds_lost": ("player_passing", "sacked_yds"),
+    "sacks": ("player_sacks", "sacks"),
+    "interceptions": ("player_interceptions", "int_count"),
+    "punt_count": ("player_punting", "punts"),
+    "punt_yds": ("player_punting", "yds"),
+}
+
+INSERT_TEAM_TOTALS_SQL = (
+    f"INSERT OR REPLACE INTO team_game_stats "
+    f"(game_id, team, {', '.join(TEAM_TOTAL_SOURCES)}, total_points) "
+    f"VALUES ({', '.join('?' for _ in range(len(TEAM_TOTAL_SOURCES) + 3))})"
+)
+
+# Team names that count as the Saints when attributing total_points
+SAINTS_TEAM_NAMES = ("New Orleans Saints", "NO", "Saints")
+
+
+def _scoring_play_values(play: dict) -> tuple:
+    return (play["game_id"], play.get("quarter"), play.get("team"),
+            play.get("description"), play.get("saints_score"), play.get("opp_score"))
+
 
 def init_db(path: str) -> sqlite3.Connection:
     """Create all tables and indexes. Returns a connection."""
     conn = sqlite3.connect(path)
     conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")   # WAL makes this crash-safe
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
     conn.execute("PRAGMA foreign_keys=ON")
     conn.executescript(SCHEMA)
 
@@ -211,32 +274,36 @@ def upsert_game(conn: sqlite3.Connection, game: dict) -> None:
 
 def upsert_player(conn: sqlite3.Connection, player_id: str, name: str, url: str | None = None) -> None:
     """Insert a player if not already present."""
-    conn.execute(
-        "INSERT OR IGNORE INTO players (player_id, player_name, pfa_url) VALUES (?, ?, ?)",
-        (player_id, name, url),
+    conn.execute(UPSERT_PLAYER_SQL, (player_id, name, url))
+
+
+def upsert_players(conn: sqlite3.Connection, players: dict) -> None:
+    """Insert players from a {player_id: {name, url}} mapping, skipping known ones."""
+    conn.executemany(
+        UPSERT_PLAYER_SQL,
+        [(pid, p["name"], p.get("url")) for pid, p in players.items()],
     )
 
 
 def insert_stat_row(conn: sqlite3.Connection, table: str, row: dict) -> None:
     """Insert a stat row into the given table. Uses INSERT OR REPLACE."""
+    conn.execute(INSERT_SQL[table], [row.get(c) for c in STAT_TABLE_COLS[table]])
+
+
+def insert_stat_rows(conn: sqlite3.Connection, table: str, rows: list[dict]) -> None:
+    """Insert many stat rows into one table with a single executemany."""
     cols = STAT_TABLE_COLS[table]
-    placeholders = ", ".join("?" for _ in cols)
-    col_str = ", ".join(cols)
-    vals = [row.get(c) for c in cols]
-    conn.execute(
-        f"INSERT OR REPLACE INTO {table} ({col_str}) VALUES ({placeholders})",
-        vals,
-    )
+    conn.executemany(INSERT_SQL[table], [[row.get(c) for c in cols] for row in rows])
 
 
 def insert_scoring_play(conn: sqlite3.Connection, play: dict) -> None:
     """Insert a scoring play."""
-    conn.execute(
-        "INSERT INTO scoring_plays (game_id, quarter, team, description, saints_score, opp_score) "
-        "VALUES (?, ?, ?, ?, ?, ?)",
-        (play["game_id"], play.get("quarter"), play.get("team"),
-         play.get("description"), play.get("saints_score"), play.get("opp_score")),
-    )
+    conn.execute(INSERT_SCORING_PLAY_SQL, _scoring_play_values(play))
+
+
+def insert_scoring_plays(conn: sqlite3.Connection, plays: list[dict]) -> None:
+    """Insert a game's scoring plays in order."""
+    conn.executemany(INSERT_SCORING_PLAY_SQL, [_scoring_play_values(p) for p in plays])
 
 
 def clear_game_stats(conn: sqlite3.Connection, game_id: str) -> None:
@@ -247,74 +314,70 @@ def clear_game_stats(conn: sqlite3.Connection, game_id: str) -> None:
     conn.execute("DELETE FROM team_game_stats WHERE game_id = ?", (game_id,))
 
 
-def compute_team_totals(conn: sqlite3.Connection, game_id: str) -> None:
-    """Aggregate player stats into team_game_stats for a given game."""
-    # Get distinct teams in this game from rushing (most reliable — nearly every game has rushers)
-    teams = [r[0] for r in conn.execute(
-        "SELECT DISTINCT team FROM player_rushing WHERE game_id = ? "
-        "UNION SELECT DISTINCT team FROM player_passing WHERE game_id = ?",
-        (game_id, game_id),
-    ).fetchall()]
-
-    for team in teams:
-        rush = conn.execute(
-            "SELECT COALESCE(SUM(att),0), COALESCE(SUM(yds),0), COALESCE(SUM(td),0) "
-            "FROM player_rushing WHERE game_id=? AND team=?", (game_id, team)
-        ).fetchone()
-        passing = conn.execute(
-            "SELECT COALESCE(SUM(att),0), COALESCE(SUM(com),0), COALESCE(SUM(yds),0), "
-            "COALESCE(SUM(td),0), COALESCE(SUM(int_thrown),0), "
-            "COALESCE(SUM(sacked),0), COALESCE(SUM(sacked_yds),0) "
-            "FROM player_passing WHERE game_id=? AND team=?", (game_id, team)
-        ).fetchone()
-        sacks = conn.execute(
-            "SELECT COALESCE(SUM(sacks),0) FROM player_sacks WHERE game_id=? AND team=?",
-            (game_id, team),
-        ).fetchone()
-        ints = conn.execute(
-            "SELECT COALESCE(SUM(int_count),0) FROM player_interceptions WHERE game_id=? AND team=?",
-            (game_id, team),
-        ).fetchone()
-        punting = conn.execute(
-            "SELECT COALESCE(SUM(punts),0), COALESCE(SUM(yds),0) "
-            "FROM player_punting WHERE game_id=? AND team=?", (game_id, team)
-        ).fetchone()
-
-        # Get total points from the games table
-        game = conn.execute(
-            "SELECT saints_score, opponent_score, home_away, opponent FROM games WHERE game_id=?",
-            (game_id,),
-        ).fetchone()
+def team_totals_from_box(box: dict) -> list[dict]:
+    """Sum a parsed box score's player rows into team_game_stats columns.
+
+    Works on the in-memory box["stats"] rather than re-reading the rows just
+    inserted. One dict per team that has rushing or passing rows.
+    """
+    # INSERT OR REPLACE keeps the last row per (player, team); do the same
+    latest = {
+        table: {(row["player_id"], row["team"]): row for row in rows}
+        for table, rows in box["stats"].items()
+    }
+    teams = {
+        team
+        for table in ("player_rushing", "player_passing")
+        for _, team in latest.get(table, {})
+    }
+    totals = {team: {"team": team, **dict.fromkeys(TEAM_TOTAL_SOURCES, 0)} for team in teams}
+    for col, (table, src) in TEAM_TOTAL_SOURCES.items():
+        for (_, team), row in latest.get(table, {}).items():
+            if team in totals and row.get(src) is not None:
+                totals[team][col] += row[src]
+    return list(totals.values())
+
+
+def insert_team_totals(conn: sqlite3.Connection, game_id: str, totals: list[dict]) -> None:
+    """Write team_totals_from_box() rows, adding each team's points from games."""
+    game = conn.execute(
+        "SELECT saints_score, opponent_score FROM games WHERE game_id=?", (game_id,)
+    ).fetchone()
+    rows = []
+    for t in totals:
         total_points = None
         if game:
-            saints_score, opp_score, home_away, opponent = game
-            # Determine if this team is Saints or opponent
-            # We use "New Orleans Saints" as the Saints identifier
-            if team in ("New Orleans Saints", "NO", "Saints"):
-                total_points = saints_score
-            else:
-                total_points = opp_score
-
-        conn.execute(
-            "INSERT OR REPLACE INTO team_game_stats "
-            "(game_id, team, rush_att, rush_yds, rush_td, "
-            "pass_att, pass_com, pass_yds, pass_td, pass_int, "
-            "times_sacked, sack_yds_lost, sacks, interceptions, "
-            "punt_count, punt_yds, total_points) "
-            "VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)",
-            (game_id, team,
-             rush[0], rush[1], rush[2],
-             passing[0], passing[1], passing[2], passing[3], passing[4],
-             passing[5], passing[6],
-             sacks[0], ints[0],
-             punting[0], punting[1],
-             total_points),
-        )
-
-
-def game_exists(conn: sqlite3.Connection, game_id: str) -> bool:
-    """Check if a game's box score stats have already been scraped."""
+            saints_score, opp_score = game
+            total_points = saints_score if t["team"] in SAINTS_TEAM_NAMES else opp_score
+        rows.append((game_id, t["team"], *(t[c] for c in TEAM_TOTAL_SOURCES), total_points))
+    conn.executemany(INSERT_TEAM_TOTALS_SQL, rows)
+
+
+def get_page_validators(conn: sqlite3.Connection, url: str) -> dict:
+    """Return the stored ETag / Last-Modified for a page (empty if unknown)."""
     row = conn.execute(
-        "SELECT COUNT(*) FROM player_rushing WHERE game_id = ?", (game_id,)
+        "SELECT etag, last_modified FROM page_validators WHERE url = ?", (url,)
     ).fetchone()
-    return row[0] > 0
+    return {"etag": row[0], "last_modified": row[1]} if row else {}
+
+
+def save_page_validators(conn: sqlite3.Connection, url: str, validators: dict) -> None:
+    """Store the ETag / Last-Modified a page was served with."""
+    if not validators.get("etag") and not validators.get("last_modified"):
+        return
+    conn.execute(
+        "INSERT OR REPLACE INTO page_validators (url, etag, last_modified) VALUES (?, ?, ?)",
+        (url, validators.get("etag"), validators.get("last_modified")),
+    )
+
+
+def scraped_game_ids(conn: sqlite3.Connection, game_ids: list[str]) -> set[str]:
+    """Return the subset of game_ids whose box score stats are already scraped."""
+    if not game_ids:
+        return set()
+    placeholders = ",".join("?" * len(game_ids))
+    rows = conn.execute(
+        f"SELECT DISTINCT game_id FROM player_rushing WHERE game_id IN ({placeholders})",
+        game_ids,
+    )
+    return {row[0] for row in rows}
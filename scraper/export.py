@@ -3,7 +3,42 @@
 import json
 import os
 import sqlite3
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # fall back to the (slower) stdlib encoder
+    orjson = None
+
+# Source table and games_flat key -> stat column for each stat_type
+STAT_SOURCES = {
+    "passing": ("player_passing", {
+        "pass_att": "att", "pass_com": "com", "pass_yds": "yds",
+        "pass_td": "td", "pass_int": "int_thrown", "pass_rtg": "rtg",
+        "sacked": "sacked", "sacked_yds": "sacked_yds",
+    }),
+    "rushing": ("player_rushing", {
+        "rush_att": "att", "rush_yds": "yds", "rush_td": "td",
+        "rush_avg": "avg", "rush_lg": "lg",
+    }),
+    "receiving": ("player_receiving", {
+        "rec": "rec", "rec_yds": "yds", "rec_td": "td",
+        "rec_avg": "avg", "rec_lg": "lg", "rec_tar": "tar",
+    }),
+}
+
+# Numeric columns emitted per stat_type in games_flat (summed into totals)
+NUMERIC_COLS = {st: tuple(cols) for st, (_, cols) in STAT_SOURCES.items()}
+
+# Aggregates backed by REAL columns (rounded to 2 places on output)
+FLOAT_COLS = frozenset({"pass_rtg", "rush_avg", "rec_avg"})
+
+# Stat rows that belong in the export: Saints players in games with box scores.
+# The team list is resolved once per export by _saints_teams().
+SAINTS_FILTER = "WHERE g.boxscore_url IS NOT NULL AND ps.team IN ({teams}) "
 
 
 def export_json(db_path: str, output_dir: str) -> None:
@@ -18,162 +53,159 @@ def export_json(db_path: str, output_dir: str) -> None:
 
     conn = sqlite3.connect(db_path)
     conn.row_factory = sqlite3.Row
+    # Export is a handful of large scans: keep the whole DB mapped and cached
+    for pragma in (
+        "journal_mode=WAL", "synchronous=NORMAL", "temp_store=MEMORY",
+        "mmap_size=268435456", "cache_size=-65536",
+    ):
+        conn.execute(f"PRAGMA {pragma}")
+
+    # Season files are rendered inside SQLite on worker threads (the GIL is
+    # released while a query runs), so they overlap the dashboard build below
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        season_jobs = _submit_season_files(pool, conn, db_path, output_dir)
+
+        saints_teams = _saints_teams(conn)
+        games_flat = _build_games_flat(conn, saints_teams)
+        players_out = _build_players(conn, games_flat)
+        season_summary = _build_season_summary(conn, saints_teams)
+        seasons_covered = sorted({g["season"] for g in games_flat})
+
+        dashboard = {
+            "meta": {
+                "generated": datetime.now().isoformat(),
+                "team": "New Orleans Saints",
+                "total_records": len(games_flat),
+                "total_players": len(players_out),
+                "seasons_covered": seasons_covered,
+                "source": "Pro Football Archives",
+            },
+            "players": players_out,
+            "games_flat": games_flat,
+            "season_summary": season_summary,
+        }
+
+        # Write main dashboard file
+        latest_path = Path(output_dir) / "saints_dashboard_latest.json"
+        _write_json(latest_path, dashboard)
+        print(f"  Wrote {latest_path} ({len(games_flat)} records, {len(players_out)} players)")
 
-    games_flat = _build_games_flat(conn)
-    players_out = _build_players(conn, games_flat)
-    season_summary = _build_season_summary(conn, games_flat)
-    seasons_covered = sorted(set(g["season"] for g in games_flat))
-
-    dashboard = {
-        "meta": {
-            "generated": datetime.now().isoformat(),
-            "team": "New Orleans Saints",
-            "total_records": len(games_flat),
-            "total_players": len(players_out),
-            "seasons_covered": seasons_covered,
-            "source": "Pro Football Archives",
-        },
-        "players": players_out,
-        "games_flat": games_flat,
-        "season_summary": season_summary,
-    }
-
-    # Write main dashboard file
-    latest_path = os.path.join(output_dir, "saints_dashboard_latest.json")
-    with open(latest_path, "w") as f:
-        json.dump(dashboard, f, separators=(",", ":"), default=str)
-    print(f"  Wrote {latest_path} ({len(games_flat)} records, {len(players_out)} players)")
-
-    # Write per-season files
-    _write_season_files(conn, output_dir)
+        for future in season_jobs:
+            future.result()  # re-raise any worker error
+    print(f"  Wrote {len(season_jobs)} season files to {Path(output_dir) / 'seasons'}")
 
     conn.close()
 
 
-def _build_games_flat(conn: sqlite3.Connection) -> list[dict]:
+def _dumps(data) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(",", ":"), default=str).encode()
+
+
+def _write_json(path: Path, data: dict) -> None:
+    """Write a JSON object to path one top-level key at a time.
+
+    Only one section's serialized bytes are held in memory at once, instead
+    of the whole document; list sections are written in chunks of rows.
+    """
+    with open(path, "wb") as f:
+        sep = b"{"
+        for key, value in data.items():
+            f.write(sep + _dumps(key) + b":")
+            if isinstance(value, list):
+                _write_array(f, value)
+            else:
+                f.write(_dumps(value))
+            sep = b","
+        f.write(b"}" if data else b"{}")
+
+
+def _write_array(f, items: list, chunk: int = 100) -> None:
+    """Write a JSON array a chunk of elements at a time (same bytes as _dumps)."""
+    f.write(b"[")
+    for start in range(0, len(items), chunk):
+        if start:
+            f.write(b",")
+        # Drop the chunk's own brackets without copying the buffer
+        f.write(memoryview(_dumps(items[start:start + chunk]))[1:-1])
+    f.write(b"]")
+
+
+def _saints_teams(conn: sqlite3.Connection) -> tuple:
+    """Return the distinct team strings that identify the Saints in stat rows."""
+    return tuple(r[0] for r in conn.execute(" UNION ".join(
+        f"SELECT DISTINCT team FROM {table} "
+        "WHERE team LIKE '%New Orleans%' OR team LIKE '%Saints%'"
+        for table, _ in STAT_SOURCES.values()
+    )))
+
+
+def _saints_filter(saints_teams: tuple) -> str:
+    """SAINTS_FILTER with one placeholder per team string."""
+    return SAINTS_FILTER.format(teams=", ".join("?" * len(saints_teams)))
+
+
+def _build_games_flat(conn: sqlite3.Connection, saints_teams: tuple) -> list[dict]:
     """Build the flat games array matching the old dashboard format.
 
     One row per player per game per stat_type (passing, rushing, receiving).
-    Only includes Saints players.
+    Only includes Saints players. Each stat table is read with one query that
+    already returns the output keys, in output order, via column aliases.
     """
     rows = []
-
-    # Get all games (only those with box scores)
-    games = conn.execute(
-        "SELECT * FROM games WHERE boxscore_url IS NOT NULL ORDER BY game_date"
-    ).fetchall()
-
-    game_map = {g["game_id"]: dict(g) for g in games}
-
-    # Passing stats (Saints players only)
-    for stat in conn.execute(
-        "SELECT p.player_name, ps.* FROM player_passing ps "
-        "JOIN players p ON ps.player_id = p.player_id "
-        "WHERE ps.team LIKE '%New Orleans%' OR ps.team LIKE '%Saints%' "
-        "ORDER BY ps.game_id"
-    ).fetchall():
-        game = game_map.get(stat["game_id"])
-        if not game:
-            continue
-        rows.append({
-            "player": stat["player_name"],
-            "player_id": stat["player_id"],
-            "season": game["season"],
-            "game_date": game["game_date"],
-            "opponent": game["opponent"],
-            "game_location": "Home" if game["home_away"] == "home" else "Away",
-            "result": game["result"],
-            "stat_type": "passing",
-            "pass_att": stat["att"],
-            "pass_com": stat["com"],
-            "pass_yds": stat["yds"],
-            "pass_td": stat["td"],
-            "pass_int": stat["int_thrown"],
-            "pass_rtg": stat["rtg"],
-            "sacked": stat["sacked"],
-            "sacked_yds": stat["sacked_yds"],
-        })
-
-    # Rushing stats
-    for stat in conn.execute(
-        "SELECT p.player_name, ps.* FROM player_rushing ps "
-        "JOIN players p ON ps.player_id = p.player_id "
-        "WHERE ps.team LIKE '%New Orleans%' OR ps.team LIKE '%Saints%' "
-        "ORDER BY ps.game_id"
-    ).fetchall():
-        game = game_map.get(stat["game_id"])
-        if not game:
-            continue
-        rows.append({
-            "player": stat["player_name"],
-            "player_id": stat["player_id"],
-            "season": game["season"],
-            "game_date": game["game_date"],
-            "opponent": game["opponent"],
-            "game_location": "Home" if game["home_away"] == "home" else "Away",
-            "result": game["result"],
-            "stat_type": "rushing",
-            "rush_att": stat["att"],
-            "rush_yds": stat["yds"],
-            "rush_td": stat["td"],
-            "rush_avg": stat["avg"],
-            "rush_lg": stat["lg"],
-        })
-
-    # Receiving stats
-    for stat in conn.execute(
-        "SELECT p.player_name, ps.* FROM player_receiving ps "
-        "JOIN players p ON ps.player_id = p.player_id "
-        "WHERE ps.team LIKE '%New Orleans%' OR ps.team LIKE '%Saints%' "
-        "ORDER BY ps.game_id"
-    ).fetchall():
-        game = game_map.get(stat["game_id"])
-        if not game:
-            continue
-        rows.append({
-            "player": stat["player_name"],
-            "player_id": stat["player_id"],
-            "season": game["season"],
-            "game_date": game["game_date"],
-            "opponent": game["opponent"],
-            "game_location": "Home" if game["home_away"] == "home" else "Away",
-            "result": game["result"],
-            "stat_type": "receiving",
-            "rec": stat["rec"],
-            "rec_yds": stat["yds"],
-            "rec_td": stat["td"],
-            "rec_avg": stat["avg"],
-            "rec_lg": stat["lg"],
-            "rec_tar": stat["tar"],
-        })
+    saints_only = _saints_filter(saints_teams)
+
+    for stat_type, (table, cols) in STAT_SOURCES.items():
+        stat_cols = ", ".join(f"ps.{src} AS {key}" for key, src in cols.items())
+        cur = conn.cursor()
+        cur.row_factory = None  # plain tuples, zipped with the column names
+        cur.execute(
+            "SELECT p.player_name AS player, ps.player_id, "
+            "g.season, g.game_date, g.opponent, "
+            "CASE g.home_away WHEN 'home' THEN 'Home' ELSE 'Away' END AS game_location, "
+            f"g.result, '{stat_type}' AS stat_type, {stat_cols} FROM {table} ps "
+            "JOIN players p ON ps.player_id = p.player_id "
+            "JOIN games g ON g.game_id = ps.game_id "
+            + saints_only +
+            "ORDER BY ps.game_id",
+            saints_teams,
+        )
+        keys = [d[0] for d in cur.description]
+        rows.extend(dict(zip(keys, r)) for r in cur)
 
     return rows
 
 
 def _build_players(conn: sqlite3.Connection, games_flat: list[dict]) -> list[dict]:
     """Build the players array with career stats from games_flat."""
+    # Single pass: group rows by player and by (player, stat_type)
     player_games = {}
+    typed_games = defaultdict(list)
     for g in games_flat:
         pid = g["player_id"]
         if pid not in player_games:
             player_games[pid] = {"name": g["player"], "games": []}
         player_games[pid]["games"].append(g)
+        typed_games[pid, g["stat_type"]].append(g)
 
     players_out = []
     for pid, data in player_games.items():
         games = data["games"]
-        seasons = sorted(set(g["season"] for g in games))
+        seasons = sorted({g["season"] for g in games})
 
         career = {}
         for stat_type in ("passing", "rushing", "receiving"):
-            typed = [g for g in games if g["stat_type"] == stat_type]
+            typed = typed_games.get((pid, stat_type))
             if not typed:
                 continue
+            # Column-wise sums; a column with no values stays out of totals
             totals = {}
-            for g in typed:
-                for k, v in g.items():
-                    if isinstance(v, (int, float)) and v is not None and k not in ("season",):
-                        totals[k] = totals.get(k, 0) + (v or 0)
+            for k in NUMERIC_COLS[stat_type]:
+                values = [g[k] for g in typed if g[k] is not None]
+                if values:
+                    totals[k] = sum(values)
             totals["games_played"] = len(typed)
             # Round floats
             for k, v in totals.items():
@@ -193,68 +225,88 @@ def _build_players(conn: sqlite3.Connection, games_flat: list[dict]) -> list[dic
     return players_out
 
 
-def _build_season_summary(conn: sqlite3.Connection, games_flat: list[dict]) -> list[dict]:
-    """Build season summary aggregates."""
+def _build_season_summary(conn: sqlite3.Connection, saints_teams: tuple) -> list[dict]:
+    """Build season summary aggregates with one GROUP BY query per stat table."""
     by_season = {}
-    for g in games_flat:
-        s = g["season"]
-        if s not in by_season:
-            by_season[s] = {}
-        st = g["stat_type"]
-        if st not in by_season[s]:
-            by_season[s][st] = {"rows": [], "players": set()}
-        by_season[s][st]["rows"].append(g)
-        by_season[s][st]["players"].add(g["player_id"])
-
-    summary = []
-    for season in sorted(by_season):
-        entry = {"season": season, "stat_types": {}}
-        for st, data in by_season[season].items():
+    for stat_type, (table, cols) in STAT_SOURCES.items():
+        sums = ", ".join(f"SUM(ps.{src})" for src in cols.values())
+        for row in conn.execute(
+            f"SELECT g.season, {sums}, COUNT(DISTINCT ps.player_id) FROM {table} ps "
+            "JOIN players p ON ps.player_id = p.player_id "
+            "JOIN games g ON g.game_id = ps.game_id "
+            + _saints_filter(saints_teams) +
+            "GROUP BY g.season",
+            saints_teams,
+        ):
+            season, *values, unique_players = row
             totals = {}
-            for g in data["rows"]:
-                for k, v in g.items():
-                    if isinstance(v, (int, float)) and v is not None and k not in ("season",):
-                        totals[k] = totals.get(k, 0) + (v or 0)
-            totals["unique_players"] = len(data["players"])
-            for k, v in totals.items():
-                if isinstance(v, float):
-                    totals[k] = round(v, 2)
-            entry["stat_types"][st] = totals
-        summary.append(entry)
+            for k, v in zip(cols, values):
+                if v is not None:
+                    totals[k] = round(v, 2) if k in FLOAT_COLS else v
+            totals["unique_players"] = unique_players
+            by_season.setdefault(season, {})[stat_type] = totals
 
-    return summary
+    return [
+        {"season": season, "stat_types": by_season[season]}
+        for season in sorted(by_season)
+    ]
 
 
-def _write_season_files(conn: sqlite3.Connection, output_dir: str) -> None:
-    """Write per-season JSON files with full game details."""
-    seasons_dir = os.path.join(output_dir, "seasons")
+def _submit_season_files(pool: ThreadPoolExecutor, conn: sqlite3.Connection,
+                         db_path: str, output_dir: str) -> list:
+    """Queue one seasons/{YYYY}.json job per season; returns the futures.
+
+    Each job runs on its own read-only connection.
+    """
+    seasons_dir = Path(output_dir) / "seasons"
 
     seasons = [r[0] for r in conn.execute(
         "SELECT DISTINCT season FROM games ORDER BY season"
     ).fetchall()]
+    sql = _season_json_sql(conn)
+    db_uri = f"{Path(db_path).resolve().as_uri()}?mode=ro"
 
-    for season in seasons:
-        games = [dict(r) for r in conn.execute(
-            "SELECT * FROM games WHERE season = ? ORDER BY game_date", (season,)
-        ).fetchall()]
-
-        # Attach box score stats to each game
-        for game in games:
-            gid = game["game_id"]
-            game["team_stats"] = [dict(r) for r in conn.execute(
-                "SELECT * FROM team_game_stats WHERE game_id = ?", (gid,)
-            ).fetchall()]
-            game["scoring_plays"] = [dict(r) for r in conn.execute(
-                "SELECT * FROM scoring_plays WHERE game_id = ? ORDER BY id", (gid,)
-            ).fetchall()]
-
-        season_data = {
-            "season": season,
-            "games": games,
-        }
+    return [
+        pool.submit(_export_one_season, db_uri, sql, season, seasons_dir)
+        for season in seasons
+    ]
 
-        path = os.path.join(seasons_dir, f"{season}.json")
-        with open(path, "w") as f:
-            json.dump(season_data, f, separators=(",", ":"), default=str)
 
-    print(f"  Wrote {len(seasons)} season files to {seasons_dir}")
+def _season_json_sql(conn: sqlite3.Connection) -> str:
+    """Build a query that renders one season's file body as JSON inside SQLite.
+
+    Produces {"season": ..., "games": [{<games columns>, "team_stats": [...],
+    "scoring_plays": [...]}]}, with keys in table column order. json() re-tags
+    subquery results as JSON so they nest instead of being quoted as strings.
+    """
+    def fields(table: str, alias: str) -> str:
+        cols = [r[1] for r in conn.execute(f"PRAGMA table_info({table})")]
+        return ", ".join(f"'{c}', {alias}.{c}" for c in cols)
+
+    return (
+        "SELECT json_object('season', :season, 'games', json(("
+        "  SELECT json_group_array(json(game)) FROM ("
+        f"   SELECT json_object({fields('games', 'g')},"
+        "     'team_stats', json(("
+        "       SELECT json_group_array(json(ts)) FROM ("
+        f"        SELECT json_object({fields('team_game_stats', 't')}) AS ts "
+        "         FROM team_game_stats t WHERE t.game_id = g.game_id ORDER BY t.team))),"
+        "     'scoring_plays', json(("
+        "       SELECT json_group_array(json(sp)) FROM ("
+        f"        SELECT json_object({fields('scoring_plays', 's')}) AS sp "
+        "         FROM scoring_plays s WHERE s.game_id = g.game_id ORDER BY s.id)))"
+        "   ) AS game "
+        "   FROM games g WHERE g.season = :season ORDER BY g.game_date))))"
+    )
+
+
+def _export_one_season(db_uri: str, sql: str, season: int, seasons_dir: Path) -> None:
+    """Write seasons/{season}.json using a dedicated read-only connection."""
+    conn = sqlite3.connect(db_uri, uri=True)
+    conn.execute("PRAGMA mmap_size=268435456")
+    try:
+        (text,) = conn.execute(sql, {"season": season}).fetchone()
+    finally:
+        conn.close()
+
+    (seasons_dir / f"{season}.json").write_text(text, encoding="utf-8")
@@ -8,11 +8,62 @@ Team tables come in pairs: away team first (even index), home team second (odd).
 """
 
 import re
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 
+import lxml.etree
+import lxml.html
+
 BASE_URL = "https://www.footballdb.com"
 
+# One parser for every page: building a new one per document is pure overhead
+_PARSER = lxml.html.HTMLParser(recover=True)
+
+# Patterns used on every results link / player cell, compiled once
+_BOX_HREF_RE = re.compile(r"/games/boxscore/")
+_DATE_TAIL_RE = re.compile(r"(\d{8})\d{2}$")
+_OPP_RE = re.compile(r"(.+?) vs (.+?) Box Score")
+_PLAYER_ID_RE = re.compile(r"/players/[\w-]+-(\w+)$")
+_ABBREV_NAME_RE = re.compile(r"[A-Z]+\.\xa0")
+
+# Real-valued stat columns; everything else parses as int
+FLOAT_COLS = frozenset({"avg", "pct", "rtg", "sacks"})
+
+# Stat tables come in (away, home) pairs starting at table index 4, in this
+# order: passing, rushing, receiving, punt_returns, kick_returns, punting,
+# kicking, kickoffs, defense, fumbles (None = not parsed)
+STAT_SEQUENCE = (
+    "passing", "rushing", "receiving",
+    "punt_returns", "kick_returns",
+    "punting", None,  # kicking (skip)
+    "kickoffs",
+    "defense", None,  # fumbles (skip)
+)
+STAT_TABLE_OFFSETS = {
+    stat_type: (4 + 2 * i, 5 + 2 * i)
+    for i, stat_type in enumerate(STAT_SEQUENCE)
+    if stat_type is not None
+}
+
+# Known NFL team names, matched against the start of stat table headers
+NFL_TEAMS = (
+    "Arizona Cardinals", "Atlanta Falcons", "Baltimore Ravens",
+    "Buffalo Bills", "Carolina Panthers", "Chicago Bears",
+    "Cincinnati Bengals", "Cleveland Browns", "Dallas Cowboys",
+    "Denver Broncos", "Detroit Lions", "Green Bay Packers",
+    "Houston Texans", "Indianapolis Colts", "Jacksonville Jaguars",
+    "Kansas City Chiefs", "Las Vegas Raiders", "Los Angeles Chargers",
+    "Los Angeles Rams", "Miami Dolphins", "Minnesota Vikings",
+    "New England Patriots", "New Orleans Saints", "New York Giants",
+    "New York Jets", "Philadelphia Eagles", "Pittsburgh Steelers",
+    "San Francisco 49ers", "Seattle Seahawks", "Tampa Bay Buccaneers",
+    "Tennessee Titans", "Washington Commanders",
+)
+
+# Candidate teams keyed by city's first word ("New" and "Los" are shared)
+_TEAMS_BY_FIRST_WORD = {}
+for _team in NFL_TEAMS:
+    _TEAMS_BY_FIRST_WORD.setdefault(_team.split()[0], []).append(_team)
+
 # Table identification by header columns
 TABLE_TYPES = {
     # (header_col_1, header_col_2, ...): (stat_type, col_mapping)
@@ -97,16 +148,17 @@ def parse_footballdb_results(html: str, season: int) -> list[dict]:
     Returns list of dicts with: game_date, opponent, home_away, saints_score,
     opponent_score, result, boxscore_url, game_type.
     """
-    soup = BeautifulSoup(html, "lxml")
+    root = _parse_html(html)
     games = []
 
-    links = soup.find_all("a", href=re.compile(r"/games/boxscore/"))
-    for link in links:
-        href = link["href"]
+    for link in root.iter("a"):
+        href = link.get("href")
+        if not href or not _BOX_HREF_RE.search(href):
+            continue
         url = urljoin(BASE_URL, href)
 
         # Extract date from URL: ...-2025090701 -> 20250907
-        date_match = re.search(r"(\d{8})\d{2}$", href)
+        date_match = _DATE_TAIL_RE.search(href)
         if not date_match:
             continue
         date_str = date_match.group(1)
@@ -119,9 +171,9 @@ def parse_footballdb_results(html: str, season: int) -> list[dict]:
         is_saints_away = slug.split("-vs-")[0].startswith("new-orleans")
 
         # Extract opponent from link text
-        link_text = link.get_text(strip=True)
+        link_text = _text(link)
         # "Cardinals vs Saints Box Score" or "Saints vs Seahawks Box Score"
-        opp_match = re.match(r"(.+?) vs (.+?) Box Score", link_text)
+        opp_match = _OPP_RE.match(link_text)
         if opp_match:
             if is_saints_home:
                 opponent = opp_match.group(1).strip()
@@ -162,8 +214,8 @@ def parse_footballdb_boxscore(html: str, game_id: str) -> dict:
         - stats: {table_name: [row_dicts]}
         - players: {player_id: {name, url}}
     """
-    soup = BeautifulSoup(html, "lxml")
-    tables = soup.find_all("table")
+    root = _parse_html(html)
+    tables = list(root.iter("table"))
 
     result = {
         "teams": (None, None),
@@ -183,10 +235,10 @@ def parse_footballdb_boxscore(html: str, game_id: str) -> dict:
 
     # --- Score by quarters (table 0) ---
     if tables:
-        qtr_rows = tables[0].find_all("tr")
+        qtr_rows = list(tables[0].iter("tr"))
         if len(qtr_rows) >= 3:
-            away_cells = qtr_rows[1].find_all("td")
-            home_cells = qtr_rows[2].find_all("td")
+            away_cells = list(qtr_rows[1].iter("td"))
+            home_cells = list(qtr_rows[2].iter("td"))
             if away_cells and home_cells:
                 result["metadata"]["away_score"] = _safe_int(_text(away_cells[-1]))
                 result["metadata"]["home_score"] = _safe_int(_text(home_cells[-1]))
@@ -209,16 +261,21 @@ def parse_footballdb_boxscore(html: str, game_id: str) -> dict:
                 continue
 
             tbl = tables[tbl_idx]
-            rows = tbl.find_all("tr")
+            rows = list(tbl.iter("tr"))
             if len(rows) < 2:
                 continue
 
-            # Get actual column headers from the table
-            header_cells = rows[0].find_all(["th", "td"])
-            headers = [c.get_text(strip=True) for c in header_cells]
+            # Get actual column headers from the table, and resolve each
+            # mapped column's (cell index, db column, parser) once per table
+            headers = [_text(c) for c in rows[0].iter("th", "td")]
+            col_parsers = _column_parsers(headers, col_map)
+            extra_parsers = {
+                extra_table: _column_parsers(headers, extra_cols)
+                for extra_table, extra_cols in config.get("extra_tables", {}).items()
+            }
 
             for row in rows[1:]:
-                cells = row.find_all("td")
+                cells = list(row.iter("td"))
                 if not cells:
                     continue
 
@@ -226,8 +283,8 @@ def parse_footballdb_boxscore(html: str, game_id: str) -> dict:
                 if player_text == "TOTAL" or not player_text:
                     continue
 
-                player_link = cells[0].find("a")
-                if not player_link:
+                player_link = cells[0].find(".//a")
+                if player_link is None:
                     continue
 
                 # Extract player name (remove abbreviated version)
@@ -250,30 +307,26 @@ def parse_footballdb_boxscore(html: str, game_id: str) -> dict:
                 }
 
                 # Map columns using header positions
-                for i, hdr in enumerate(headers[1:], 1):
-                    db_col = col_map.get(hdr)
-                    if db_col and i < len(cells):
-                        stat_row[db_col] = _parse_stat_value(
-                            _text(cells[i]), db_col
-                        )
+                for i, db_col, parse in col_parsers:
+                    if i < len(cells):
+                        stat_row[db_col] = parse(_text(cells[i]))
 
                 if table_name not in result["stats"]:
                     result["stats"][table_name] = []
                 result["stats"][table_name].append(stat_row)
 
                 # Handle defense table extra stats (interceptions, sacks)
-                if stat_type == "defense" and "extra_tables" in config:
-                    for extra_table, extra_cols in config["extra_tables"].items():
+                if stat_type == "defense" and extra_parsers:
+                    for extra_table, parsers in extra_parsers.items():
                         extra_row = {
                             "game_id": game_id,
                             "player_id": player_id,
                             "team": team_name,
                         }
                         has_data = False
-                        for i, hdr in enumerate(headers[1:], 1):
-                            db_col = extra_cols.get(hdr)
-                            if db_col and i < len(cells):
-                                val = _parse_stat_value(_text(cells[i]), db_col)
+                        for i, db_col, parse in parsers:
+                            if i < len(cells):
+                                val = parse(_text(cells[i]))
                                 extra_row[db_col] = val
                                 if val and val != 0:
                                     has_data = True
@@ -296,8 +349,17 @@ def parse_footballdb_boxscore(html: str, game_id: str) -> dict:
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _text(cell) -> str:
-    return cell.get_text(strip=True)
+def _text(el) -> str:
+    """Concatenate an element's stripped text nodes (like bs4's get_text(strip=True))."""
+    return "".join(t.strip() for t in el.itertext())
+
+
+def _parse_html(html: str):
+    """Parse a page with the shared parser; an empty body yields an empty tree."""
+    try:
+        return lxml.html.fromstring(html, parser=_PARSER)
+    except lxml.etree.ParserError:  # empty or whitespace-only document
+        return lxml.html.Element("html")
 
 
 def _safe_int(s: str) -> int | None:
@@ -308,16 +370,11 @@ def _safe_int(s: str) -> int | None:
         return None
 
 
-def _parse_stat_value(text: str, col_name: str):
-    """Parse a stat cell value."""
+def _int_or_none(text: str):
+    """Parse an integer stat cell (falls back to float, e.g. half sacks)."""
     if not text or text == "-":
         return None
     text = text.rstrip("t").strip()
-    if col_name in ("avg", "pct", "rtg", "sacks"):
-        try:
-            return float(text)
-        except ValueError:
-            return None
     try:
         return int(text)
     except ValueError:
@@ -327,22 +384,38 @@ def _parse_stat_value(text: str, col_name: str):
             return None
 
 
+def _float_or_none(text: str):
+    """Parse a real-valued stat cell."""
+    if not text or text == "-":
+        return None
+    try:
+        return float(text.rstrip("t").strip())
+    except ValueError:
+        return None
+
+
+def _column_parsers(headers: list, col_map: dict) -> list:
+    """Return (cell_index, db_col, parser) for each mapped header column."""
+    parsers = []
+    for i, hdr in enumerate(headers[1:], 1):
+        db_col = col_map.get(hdr)
+        if db_col:
+            parse = _float_or_none if db_col in FLOAT_COLS else _int_or_none
+            parsers.append((i, db_col, parse))
+    return parsers
+
+
 def _clean_player_name(text: str) -> str:
     """Clean player name from footballdb format.
 
     'Alvin KamaraA.\xa0Kamara' -> 'Alvin Kamara'
     """
-    # The abbreviated name follows the full name with no space
-    # Pattern: "Full Name" followed by "F.\xa0Last"
-    # Find where the abbreviated version starts (capital letter after lowercase)
-    for i in range(len(text) - 1, 0, -1):
-        if text[i] == "." and i >= 1:
-            # Found abbreviated name start — look back for the capital
-            j = i - 1
-            while j > 0 and text[j].isupper():
-                j -= 1
-            if j > 0 and j < i:
-                return text[:j + 1].strip()
+    # The abbreviated name ("F.\xa0Last") follows the full name with no space
+    if "\xa0" not in text:
+        return text
+    match = _ABBREV_NAME_RE.search(text)
+    if match:
+        return text[:match.start()].strip()
     return text.replace("\xa0", " ")
 
 
@@ -351,7 +424,7 @@ def _extract_fdb_player_id(href: str) -> str | None:
 
     /players/alvin-kamara-kamaral01 -> fdb_kamaral01
     """
-    match = re.search(r"/players/[\w-]+-(\w+)$", href)
+    match = _PLAYER_ID_RE.search(href)
     if match:
         return f"fdb_{match.group(1)}"
     return None
@@ -363,34 +436,22 @@ def _extract_team_name(table) -> str | None:
     FootballDB puts "New Orleans SaintsNew Orleans" (full name + city) in one cell.
     We also handle abbreviated forms like "New Orleans SaintsNO".
     """
-    first_row = table.find("tr")
-    if first_row:
-        first_cell = first_row.find(["th", "td"])
-        if first_cell:
+    first_row = table.find(".//tr")
+    if first_row is not None:
+        first_cell = next(first_row.iter("th", "td"), None)
+        if first_cell is not None:
             # Use the link text if available (cleaner)
-            link = first_cell.find("a")
-            if link:
-                return link.get_text(strip=True)
+            link = first_cell.find(".//a")
+            if link is not None:
+                return _text(link)
 
-            text = first_cell.get_text(strip=True)
+            text = _text(first_cell)
 
             # Known NFL team names — try to match the full name
-            nfl_teams = [
-                "Arizona Cardinals", "Atlanta Falcons", "Baltimore Ravens",
-                "Buffalo Bills", "Carolina Panthers", "Chicago Bears",
-                "Cincinnati Bengals", "Cleveland Browns", "Dallas Cowboys",
-                "Denver Broncos", "Detroit Lions", "Green Bay Packers",
-                "Houston Texans", "Indianapolis Colts", "Jacksonville Jaguars",
-                "Kansas City Chiefs", "Las Vegas Raiders", "Los Angeles Chargers",
-                "Los Angeles Rams", "Miami Dolphins", "Minnesota Vikings",
-                "New England Patriots", "New Orleans Saints", "New York Giants",
-                "New York Jets", "Philadelphia Eagles", "Pittsburgh Steelers",
-                "San Francisco 49ers", "Seattle Seahawks", "Tampa Bay Buccaneers",
-                "Tennessee Titans", "Washington Commanders",
-            ]
-            for team in nfl_teams:
-                if text.startswith(team):
-                    return team
+            if text.startswith(NFL_TEAMS):
+                for team in _TEAMS_BY_FIRST_WORD[text.split()[0]]:
+                    if text.startswith(team):
+                        return team
             return text
     return None
 
@@ -398,34 +459,11 @@ def _extract_team_name(table) -> str | None:
 def _identify_stat_tables(tables: list) -> dict:
     """Identify which table indices correspond to which stat types.
 
-    Returns dict of stat_type -> (away_table_idx, home_table_idx).
+    Returns dict of stat_type -> (away_table_idx, home_table_idx) for every
+    pair present on the page. Empty tables are skipped by the caller.
     """
-    result = {}
-    i = 4  # First stat tables typically start at index 4
-
-    # Known sequence: passing, rushing, receiving, punt_returns, kick_returns,
-    # punting, kicking, kickoffs, defense, fumbles
-    stat_sequence = [
-        "passing", "rushing", "receiving",
-        "punt_returns", "kick_returns",
-        "punting", None,  # kicking (skip)
-        "kickoffs",
-        "defense", None,  # fumbles (skip)
-    ]
-
-    for stat_type in stat_sequence:
-        if i + 1 >= len(tables):
-            break
-
-        # Verify this looks like a stat table (has player data rows)
-        rows = tables[i].find_all("tr")
-        if len(rows) < 2:
-            i += 2
-            continue
-
-        if stat_type is not None:
-            result[stat_type] = (i, i + 1)
-
-        i += 2
-
-    return result
+    return {
+        stat_type: pair
+        for stat_type, pair in STAT_TABLE_OFFSETS.items()
+        if pair[1] < len(tables)
+    }
@@ -1,11 +1,16 @@
 """HTML parsers for Pro Football Archives season pages and box scores."""
 
 import re
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 
+import lxml.etree
+import lxml.html
+
 BASE_URL = "https://www.profootballarchives.com/"
 
+# One parser for every page: building a new one per document is pure overhead
+_PARSER = lxml.html.HTMLParser(recover=True)
+
 # ---------------------------------------------------------------------------
 # Season page parsing
 # ---------------------------------------------------------------------------
@@ -17,13 +22,13 @@ def parse_season_page(html: str, season: int) -> list[dict]:
     opponent, opponent_abbr, home_away, saints_score, opponent_score, result,
     overtime, location, venue, attendance, boxscore_url.
     """
-    soup = BeautifulSoup(html, "lxml")
+    root = _parse_html(html)
 
     # Find the SCORES table — first row text is "SCORES"
     scores_table = None
-    for table in soup.find_all("table"):
-        first_row = table.find("tr")
-        if first_row and first_row.get_text(strip=True) == "SCORES":
+    for table in root.iter("table"):
+        first_row = table.find(".//tr")
+        if first_row is not None and _text(first_row) == "SCORES":
             scores_table = table
             break
 
@@ -34,13 +39,13 @@ def parse_season_page(html: str, season: int) -> list[dict]:
     game_type = "preseason"  # default; switches to regular once we see boxscore links
     regular_started = False
 
-    for row in scores_table.find_all("tr")[1:]:  # skip the "SCORES" header row
-        cells = row.find_all("td")
+    for row in list(scores_table.iter("tr"))[1:]:  # skip the "SCORES" header row
+        cells = list(row.iter("td"))
 
         # Bold single-cell row = playoff round header
         if len(cells) == 1:
             cell = cells[0]
-            if cell.find("b"):
+            if cell.find(".//b") is not None:
                 game_type = "playoff"
             continue
 
@@ -63,12 +68,12 @@ def parse_season_page(html: str, season: int) -> list[dict]:
         attendance_raw = _text(cells[10]) if len(cells) > 10 else ""
 
         # Determine if this game has a box score link
-        date_link = date_cell.find("a")
+        date_link = date_cell.find(".//a")
         boxscore_url = None
         game_id = None
 
-        if date_link:
-            href = date_link["href"]
+        if date_link is not None:
+            href = date_link.attrib["href"]
             boxscore_url = urljoin(BASE_URL, href)
             # Extract game_id from URL: /nflboxscores2/2024nfl058.html -> 2024nfl058
             match = re.search(r"(\d{4}nfl\d+)\.html", href)
@@ -85,7 +90,7 @@ def parse_season_page(html: str, season: int) -> list[dict]:
                 game_type = "preseason"
 
         # Parse date: M/D/YYYY -> YYYY-MM-DD
-        date_text = date_cell.get_text(strip=True)
+        date_text = _text(date_cell)
         game_date = _parse_date(date_text)
 
         # Generate a game_id for preseason games that don't have one
@@ -93,12 +98,12 @@ def parse_season_page(html: str, season: int) -> list[dict]:
             game_id = f"{season}pre{game_date.replace('-', '')}"
 
         # Opponent
-        opp_link = opponent_cell.find("a")
-        opponent_name = opponent_cell.get_text(strip=True)
+        opp_link = opponent_cell.find(".//a")
+        opponent_name = _text(opponent_cell)
         opponent_abbr = None
-        if opp_link:
+        if opp_link is not None:
             # Extract abbr from href: 2024nflcar.html -> car
-            opp_match = re.search(r"\d{4}nfl(\w+)\.html", opp_link["href"])
+            opp_match = re.search(r"\d{4}nfl(\w+)\.html", opp_link.attrib["href"])
             if opp_match:
                 opponent_abbr = opp_match.group(1).upper()
 
@@ -118,7 +123,7 @@ def parse_season_page(html: str, season: int) -> list[dict]:
             "season": season,
             "game_date": game_date,
             "day_of_week": day,
-            "game_type": game_type if date_link or not regular_started else "regular",
+            "game_type": game_type if date_link is not None or not regular_started else "regular",
             "opponent": opponent_name,
             "opponent_abbr": opponent_abbr,
             "home_away": home_away,
@@ -208,8 +213,8 @@ def parse_boxscore(html: str, game_id: str) -> dict:
         - stats: {table_name: [row_dicts]}  where each row_dict has game_id, player_id, team, ...
         - players: {player_id: {name, url}}
     """
-    soup = BeautifulSoup(html, "lxml")
-    tables = soup.find_all("table")
+    root = _parse_html(html)
+    tables = list(root.iter("table"))
 
     result = {
         "teams": (None, None),
@@ -223,14 +228,14 @@ def parse_boxscore(html: str, game_id: str) -> dict:
         return result
 
     # --- Table 0: Game header ---
-    header_text = tables[0].get_text(strip=True)
+    header_text = _text(tables[0])
     # "Carolina Panthers at New Orleans Saints" -> (away, home)
     match = re.match(r"(.+?)\s+at\s+(.+?)(?:Game Statistics|$)", header_text)
     if match:
         result["teams"] = (match.group(1).strip(), match.group(2).strip())
 
     # --- Table 1: Metadata ---
-    meta_text = tables[1].get_text()
+    meta_text = "".join(tables[1].itertext())
     for pattern, key in [
         (r"Date:\s*(.+?)(?=Location:|$)", "date"),
         (r"Location:\s*(.+?)(?=Venue:|$)", "location"),
@@ -246,7 +251,7 @@ def parse_boxscore(html: str, game_id: str) -> dict:
 
     # --- Table 4 (usually): Scoring plays ---
     scoring_table = _find_table_by_header(tables, "Qtr")
-    if scoring_table:
+    if scoring_table is not None:
         result["scoring_plays"] = _parse_scoring_plays(scoring_table, game_id, result["teams"])
 
     # --- Stat tables ---
@@ -256,13 +261,12 @@ def parse_boxscore(html: str, game_id: str) -> dict:
             continue
 
         table_name = config["table"]
-        rows = stat_table.find_all("tr")
+        rows = list(stat_table.iter("tr"))
         if not rows:
             continue
 
         # Determine column mapping from header row
-        header_cells = rows[0].find_all(["th", "td"])
-        header_texts = [c.get_text(strip=True) for c in header_cells]
+        header_texts = [_text(c) for c in rows[0].iter("th", "td")]
 
         col_map = _get_col_map(section_name, config, header_texts)
         if not col_map:
@@ -276,19 +280,19 @@ def parse_boxscore(html: str, game_id: str) -> dict:
         entries = []  # list of ("separator", team_name) or ("player", stat_row)
 
         for row in rows[1:]:  # skip header
-            cells = row.find_all(["th", "td"])
+            cells = list(row.iter("th", "td"))
             if not cells:
                 continue
 
             first_cell = cells[0]
-            first_text = first_cell.get_text(strip=True)
+            first_text = _text(first_cell)
 
             if _is_team_separator(cells):
                 entries.append(("separator", first_text))
                 continue
 
-            player_link = first_cell.find("a")
-            if player_link:
+            player_link = first_cell.find(".//a")
+            if player_link is not None:
                 player_name = first_text
                 player_href = player_link.get("href", "")
                 player_id = _extract_player_id(player_href)
@@ -309,7 +313,7 @@ def parse_boxscore(html: str, game_id: str) -> dict:
                         cell_idx = i + 1
                         if cell_idx < len(cells):
                             stat_row[db_col] = _parse_stat_value(
-                                cells[cell_idx].get_text(strip=True), db_col
+                                _text(cells[cell_idx]), db_col
                             )
                         else:
                             stat_row[db_col] = None
@@ -329,8 +333,17 @@ def parse_boxscore(html: str, game_id: str) -> dict:
 # Internal helpers
 # ---------------------------------------------------------------------------
 
-def _text(cell) -> str:
-    return cell.get_text(strip=True)
+def _text(el) -> str:
+    """Concatenated, per-node stripped text of an element (like get_text(strip=True))."""
+    return "".join(t.strip() for t in el.itertext())
+
+
+def _parse_html(html: str):
+    """Parse a page with the shared parser; an empty body yields an empty tree."""
+    try:
+        return lxml.html.fromstring(html, parser=_PARSER)
+    except lxml.etree.ParserError:  # empty or whitespace-only document
+        return lxml.html.Element("html")
 
 
 def _parse_date(date_str: str) -> str:
@@ -378,10 +391,10 @@ def _parse_stat_value(text: str, col_name: str):
 def _find_table_by_header(tables: list, header_text: str):
     """Find a table whose first row's first cell matches header_text."""
     for table in tables:
-        first_row = table.find("tr")
-        if first_row:
-            first_cell = first_row.find(["th", "td"])
-            if first_cell and first_cell.get_text(strip=True) == header_text:
+        first_row = table.find(".//tr")
+        if first_row is not None:
+            first_cell = next(first_row.iter("th", "td"), None)
+            if first_cell is not None and _text(first_cell) == header_text:
                 return table
     return None
 
@@ -457,7 +470,7 @@ def _is_team_separator(cells) -> bool:
     if len(cells) < 2:
         return False
     # Team separator: second cell has a colspan attribute and no player link in first
-    if cells[1].get("colspan") and not cells[0].find("a"):
+    if cells[1].get("colspan") and cells[0].find(".//a") is None:
         return True
     return False
 
@@ -493,23 +506,22 @@ def _get_col_map(section_name: str, config: dict, header_texts: list) -> list:
 
 def _parse_scoring_plays(table, game_id: str, teams: tuple) -> list[dict]:
     """Parse the scoring plays table."""
-    rows = table.find_all("tr")
+    rows = list(table.iter("tr"))
     if not rows:
         return []
 
     # Header row tells us the team abbreviations
-    header_cells = rows[0].find_all(["th", "td"])
     # Columns: Qtr, Team, Scoring Plays, AwayAbbr, HomeAbbr
 
     plays = []
     for row in rows[1:]:
-        cells = row.find_all("td")
+        cells = list(row.iter("td"))
         if len(cells) < 5:
             continue
 
         qtr_text = _text(cells[0])
         team_text = _text(cells[1])
-        description = cells[2].get_text(separator=" ", strip=True)
+        description = " ".join(t.strip() for t in cells[2].itertext() if t.strip())
         away_score = _safe_int(_text(cells[3]))
         home_score = _safe_int(_text(cells[4]))
 
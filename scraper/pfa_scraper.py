@@ -14,21 +14,34 @@ Usage:
     python pfa_scraper.py --incremental       # Current season only
     python pfa_scraper.py --export-only       # Just regenerate JSON
     python pfa_scraper.py --footballdb 2025   # Scrape a season from FootballDB
+    python pfa_scraper.py --season 2020 --refresh   # Ignore cached pages for a season
 """
 
 import argparse
 import os
+import random
 import sys
+import threading
 import time
-from datetime import datetime
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from pathlib import Path
+from urllib.parse import urlsplit
 
 import requests
 from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 
-from db import init_db, upsert_game, upsert_player, insert_stat_row, \
-    insert_scoring_play, clear_game_stats, compute_team_totals, game_exists
+try:
+    import requests_cache
+except ImportError:  # fall back to uncached sessions
+    requests_cache = None
+
+from db import init_db, upsert_game, upsert_players, insert_stat_rows, \
+    insert_scoring_plays, clear_game_stats, team_totals_from_box, insert_team_totals, \
+    scraped_game_ids, get_page_validators, save_page_validators
 from parsers import parse_season_page, parse_boxscore
 from footballdb_parser import parse_footballdb_results, parse_footballdb_boxscore
 from export import export_json
@@ -40,10 +53,21 @@ from export import export_json
 BASE_URL = "https://www.profootballarchives.com"
 FOOTBALLDB_URL = "https://www.footballdb.com"
 FIRST_SEASON = 1967   # Saints' inaugural season
-REQUEST_DELAY = 1.0   # seconds between requests (polite rate limiting)
+MIN_REQUEST_INTERVAL = 0.25   # seconds between requests to one host while it is happy
+MAX_REQUEST_INTERVAL = 5.0    # ceiling after repeated 429s
+FETCH_ATTEMPTS = 4            # tries per URL on 429, 5xx or connection errors
+MAX_BACKOFF = 30.0            # seconds; retry waits are min(2**attempt, this) + jitter
+RETRY_STATUSES = frozenset({500, 502, 503, 504})
+MAX_CONCURRENT_FETCHES = 8   # box score requests in flight at once
+COMMIT_EVERY = 25     # box scores per checkpoint commit within a season
+POOL_CONNECTIONS = 4   # distinct hosts kept in each session's pool
+POOL_MAXSIZE = 32      # keep-alive connections per host
 
 DB_PATH = os.environ.get("DB_PATH", "saints_encyclopedia.db")
 OUTPUT_DIR = os.environ.get("OUTPUT_DIR", os.path.join("..", "docs", "data"))
+HTTP_CACHE_PATH = os.environ.get("HTTP_CACHE_PATH", ".http_cache.sqlite")
+CURRENT_SEASON_TTL = timedelta(hours=6)   # pages for past seasons never expire
+NOT_MODIFIED = object()   # fetch_conditional() result for an HTTP 304
 
 
 # ---------------------------------------------------------------------------
@@ -51,13 +75,22 @@ OUTPUT_DIR = os.environ.get("OUTPUT_DIR", os.path.join("..", "docs", "data"))
 # ---------------------------------------------------------------------------
 
 def make_session(footballdb: bool = False) -> requests.Session:
-    session = requests.Session()
-    retry = Retry(
-        total=3,
-        backoff_factor=2,
-        status_forcelist=[429, 500, 502, 503, 504],
+    if requests_cache is not None:
+        # Past-season pages never change; see fetch() for per-request expiry
+        session = requests_cache.CachedSession(
+            HTTP_CACHE_PATH,
+            backend="sqlite",
+            allowable_methods=["GET"],
+            allowable_codes=[200],
+            expire_after=CURRENT_SEASON_TTL,
+        )
+    else:
+        session = requests.Session()
+    # No adapter-level Retry: _get() retries each URL on its own, with jitter
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
     )
-    adapter = HTTPAdapter(max_retries=retry)
     session.mount("https://", adapter)
     session.mount("http://", adapter)
     if footballdb:
@@ -72,25 +105,214 @@ def make_session(footballdb: bool = False) -> requests.Session:
     return session
 
 
+_sessions: dict[bool, requests.Session] = {}   # footballdb flag -> shared session
+
+
+def get_session(footballdb: bool = False) -> requests.Session:
+    """Shared session per site, so keep-alive connections carry across seasons."""
+    footballdb = bool(footballdb)
+    if footballdb not in _sessions:
+        _sessions[footballdb] = make_session(footballdb=footballdb)
+    return _sessions[footballdb]
+
+
+def close_sessions() -> None:
+    """Close the sessions handed out by get_session()."""
+    for session in _sessions.values():
+        session.close()
+    _sessions.clear()
+
+
+# ---------------------------------------------------------------------------
+# Rate limiting
+# ---------------------------------------------------------------------------
+
+class RateLimiter:
+    """Per-host request spacing that backs off on 429s and recovers on 200s.
+
+    Thread-safe: each caller reserves the next free slot, so concurrent
+    workers are spaced out rather than all sleeping the same amount.
+    """
+
+    def __init__(self, min_interval: float = MIN_REQUEST_INTERVAL,
+                 max_interval: float = MAX_REQUEST_INTERVAL):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+    def succeeded(self) -> None:
+        with self._lock:
+            self.interval = max(self.min_interval, self.interval * 0.9)
+
+    def throttled(self, retry_after: float) -> None:
+        with self._lock:
+            self.interval = min(self.max_interval, self.interval * 2)
+            self._next_slot = max(self._next_slot, time.monotonic() + retry_after)
+
+
+@lru_cache(maxsize=None)
+def _rate_limiter(host: str) -> RateLimiter:
+    return RateLimiter()
+
+
+def _retry_after(resp: requests.Response, default: float = 10.0) -> float:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    value = resp.headers.get("Retry-After")
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    return max(0.0, when.timestamp() - time.time())
+
+
 # ---------------------------------------------------------------------------
 # Fetching
 # ---------------------------------------------------------------------------
 
-def fetch(session: requests.Session, url: str) -> str | None:
-    """Fetch a URL and return the HTML text, or None on failure."""
+def _is_fresh(session: requests.Session, url: str) -> bool:
+    """True if url has an unexpired cached copy, so a GET won't hit the network."""
+    cache = getattr(session, "cache", None)
+    if cache is None:
+        return False
+    # cache.contains() also matches expired entries, which get re-fetched
+    cached = cache.get_response(cache.create_key(requests.Request("GET", url)))
+    return cached is not None and not cached.is_expired
+
+
+def _get(session: requests.Session, url: str, immutable: bool, refresh: bool,
+         headers: dict | None = None) -> requests.Response:
+    """GET through the cache and rate limiter; raises on HTTP errors."""
+    kwargs = {}
+    cache = getattr(session, "cache", None)
+    if cache is not None:
+        if refresh:
+            cache.delete(urls=[url])
+        kwargs["expire_after"] = (
+            requests_cache.NEVER_EXPIRE if immutable else CURRENT_SEASON_TTL
+        )
+    # Fresh cache hits never touch the network, so they skip the rate limiter
+    cached = _is_fresh(session, url)
+    limiter = _rate_limiter(urlsplit(url).netloc)
+    for attempt in range(FETCH_ATTEMPTS):
+        last_attempt = attempt == FETCH_ATTEMPTS - 1
+        if not cached:
+            limiter.wait()
+        cached = False
+        try:
+            resp = session.get(url, timeout=30, headers=headers, **kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            if last_attempt:
+                raise
+            _backoff(attempt)
+            continue
+        if last_attempt:
+            break
+        if resp.status_code == 429 or (
+            resp.status_code in RETRY_STATUSES and "Retry-After" in resp.headers
+        ):
+            limiter.throttled(_retry_after(resp))
+        elif resp.status_code in RETRY_STATUSES:
+            _backoff(attempt)
+        else:
+            break
+    resp.raise_for_status()
+    if not getattr(resp, "from_cache", False):
+        limiter.succeeded()
+    return resp
+
+
+def _backoff(attempt: int) -> None:
+    """Exponential backoff with jitter, so retrying workers don't stampede."""
+    time.sleep(min(MAX_BACKOFF, 2 ** attempt) + random.uniform(0, 1))
+
+
+def fetch(session: requests.Session, url: str, immutable: bool = False,
+          refresh: bool = False) -> str | None:
+    """Fetch a URL and return the HTML text, or None on failure.
+
+    immutable pages (past seasons) are cached forever; refresh drops any
+    cached copy first. Network requests are paced per host by a RateLimiter.
+    """
     try:
-        resp = session.get(url, timeout=30)
-        resp.raise_for_status()
-        return resp.text
+        return _get(session, url, immutable, refresh).text
     except requests.RequestException as e:
         print(f"  ERROR fetching {url}: {e}")
         return None
 
 
+def fetch_conditional(session: requests.Session, url: str, validators: dict,
+                      immutable: bool = False, refresh: bool = False):
+    """Fetch with If-None-Match / If-Modified-Since from stored validators.
+
+    Returns (html, validators): html is NOT_MODIFIED on a 304 and None on
+    failure; validators are the ones to store for next time.
+    """
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    try:
+        resp = _get(session, url, immutable, refresh, headers)
+    except requests.RequestException as e:
+        print(f"  ERROR fetching {url}: {e}")
+        return None, {}
+    if resp.status_code == 304:
+        return NOT_MODIFIED, validators
+    return resp.text, {
+        "etag": resp.headers.get("ETag"),
+        "last_modified": resp.headers.get("Last-Modified"),
+    }
+
+
+def _unchanged_season(conn, year: int) -> dict:
+    """Summary for a season whose list page has not changed since the last clean run."""
+    # Same quantities as a full pass: every game on the page, and the box
+    # scores that would have been skipped as already scraped
+    games, boxscores = conn.execute(
+        "SELECT COUNT(*), COUNT(boxscore_url) FROM games WHERE season = ?", (year,)
+    ).fetchone()
+    print(f"  Season page unchanged since last scrape; {boxscores} box scores up to date")
+    return {"season": year, "games": games, "boxscores": 0, "skipped": boxscores, "errors": 0}
+
+
+def fetch_many(session: requests.Session, urls: list[str], immutable: bool = False,
+               refresh: bool = False) -> Iterator[str | None]:
+    """Fetch URLs on MAX_CONCURRENT_FETCHES worker threads.
+
+    Yields HTML (or None on failure) in input order as soon as each page is
+    in, so the caller can parse and store early games while later ones are
+    still downloading. Pacing is left to the per-host RateLimiter.
+    """
+    if not urls:
+        return
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FETCHES) as pool:
+        yield from pool.map(
+            lambda url: fetch(session, url, immutable, refresh), urls
+        )
+
+
 # ---------------------------------------------------------------------------
 # Season URL
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=None)
 def season_url(year: int) -> str:
     return f"{BASE_URL}/{year}nflno.html"
 
@@ -99,8 +321,12 @@ def season_url(year: int) -> str:
 # Current NFL season
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=1)
 def current_season() -> int:
-    """Return the current NFL season year. Season starts in August."""
+    """Return the current NFL season year. Season starts in August.
+
+    Computed once per process, so a run never straddles two answers.
+    """
     now = datetime.now()
     return now.year if now.month >= 8 else now.year - 1
 
@@ -114,29 +340,32 @@ def _insert_boxscore(conn, game_id: str, box: dict, force: bool = False) -> None
     if force:
         clear_game_stats(conn, game_id)
 
-    for pid, pinfo in box["players"].items():
-        upsert_player(conn, pid, pinfo["name"], pinfo.get("url"))
+    upsert_players(conn, box["players"])
 
     for table_name, rows in box["stats"].items():
-        for row in rows:
-            insert_stat_row(conn, table_name, row)
+        insert_stat_rows(conn, table_name, rows)
 
-    for play in box.get("scoring_plays", []):
-        insert_scoring_play(conn, play)
+    insert_scoring_plays(conn, box.get("scoring_plays", []))
 
-    compute_team_totals(conn, game_id)
-    conn.commit()
+    insert_team_totals(conn, game_id, team_totals_from_box(box))
 
 
-def scrape_footballdb_season(session, conn, year: int, force: bool = False) -> dict:
+def scrape_footballdb_season(session, conn, year: int, force: bool = False,
+                             refresh: bool = False) -> dict:
     """Scrape a season from FootballDB. Returns a summary dict."""
     print(f"\n{'='*60}")
     print(f"Season {year} (FootballDB)")
     print(f"{'='*60}")
 
+    # Past seasons are final, so their pages can be served from cache forever
+    immutable = year < current_season()
+
     # Fetch results page
     url = f"{FOOTBALLDB_URL}/teams/nfl/new-orleans-saints/results/{year}"
-    html = fetch(session, url)
+    validators = {} if force or refresh else get_page_validators(conn, url)
+    html, validators = fetch_conditional(session, url, validators, immutable, refresh)
+    if html is NOT_MODIFIED:
+        return _unchanged_season(conn, year)
     if html is None:
         print(f"  SKIP: could not fetch results page for {year}")
         return {"season": year, "games": 0, "boxscores": 0, "skipped": 0, "errors": 0}
@@ -147,8 +376,7 @@ def scrape_footballdb_season(session, conn, year: int, force: bool = False) -> d
 
     # Try to get venue/attendance data from PFA season page
     # (PFA has richer game metadata even when box scores aren't available)
-    pfa_session = make_session(footballdb=False)
-    pfa_html = fetch(pfa_session, season_url(year))
+    pfa_html = fetch(get_session(footballdb=False), season_url(year), immutable, refresh)
     if pfa_html:
         pfa_games = parse_season_page(pfa_html, year)
         for game in pfa_games:
@@ -161,72 +389,90 @@ def scrape_footballdb_season(session, conn, year: int, force: bool = False) -> d
 
     # Scrape box scores from FootballDB
     boxscore_count = 0
-    skipped = 0
     errors = 0
     total = len(games)
 
-    for i, game in enumerate(games, 1):
-        game_id = game["game_id"]
-        boxscore_url = game["boxscore_url"]
-
-        if not force and game_exists(conn, game_id):
-            skipped += 1
-            continue
-
-        time.sleep(REQUEST_DELAY)
-
-        box_html = fetch(session, boxscore_url)
-        if box_html is None:
-            errors += 1
-            print(f"  [{i}/{total}] ERROR: {game_id}")
-            continue
-
-        box = parse_footballdb_boxscore(box_html, game_id)
-
-        # Upsert the game record from FootballDB data
-        away_team, home_team = box["teams"]
-        is_saints_home = home_team and "New Orleans" in home_team
-        opponent = away_team if is_saints_home else home_team
-        home_away = "home" if is_saints_home else "away"
-
-        away_score = box["metadata"].get("away_score")
-        home_score = box["metadata"].get("home_score")
-        saints_score = home_score if is_saints_home else away_score
-        opp_score = away_score if is_saints_home else home_score
-
-        result = None
-        if saints_score is not None and opp_score is not None:
-            if saints_score > opp_score:
-                result = "W"
-            elif saints_score < opp_score:
-                result = "L"
-            else:
-                result = "T"
-
-        game_record = {
-            "game_id": game_id,
-            "season": year,
-            "game_date": game["game_date"],
-            "day_of_week": None,
-            "game_type": game["game_type"],
-            "opponent": opponent or "Unknown",
-            "opponent_abbr": None,
-            "home_away": home_away,
-            "saints_score": saints_score,
-            "opponent_score": opp_score,
-            "result": result,
-            "location": None,
-            "venue": None,
-            "attendance": None,
-            "boxscore_url": boxscore_url,
-        }
-        upsert_game(conn, game_record)
-
-        _insert_boxscore(conn, game_id, box, force=force)
-        boxscore_count += 1
-
-        print(f"  [{i}/{total}] {game_id}: {game['game_date']} vs {opponent or '?'} "
-              f"({saints_score}-{opp_score} {result})")
+    # One query for the whole season instead of one per game
+    done = set() if force else scraped_game_ids(conn, [g["game_id"] for g in games])
+    pending = [(i, game) for i, game in enumerate(games, 1)
+               if game["game_id"] not in done]
+    skipped = total - len(pending)
+    if not pending:
+        print(f"\n  Season {year}: all {total} box scores already scraped")
+        save_page_validators(conn, url, validators)
+        conn.commit()
+        return {"season": year, "games": total, "boxscores": 0,
+                "skipped": skipped, "errors": 0}
+
+    # Fetch box scores concurrently; parse and write each to the DB in order
+    # on this thread as it arrives
+    box_htmls = fetch_many(session, [game["boxscore_url"] for _, game in pending],
+                           immutable, refresh)
+
+    # One transaction per season (rolled back on error), with periodic checkpoints
+    with conn:
+        for (i, game), box_html in zip(pending, box_htmls):
+            game_id = game["game_id"]
+            boxscore_url = game["boxscore_url"]
+
+            if box_html is None:
+                errors += 1
+                print(f"  [{i}/{total}] ERROR: {game_id}")
+                continue
+
+            box = parse_footballdb_boxscore(box_html, game_id)
+
+            # Upsert the game record from FootballDB data
+            away_team, home_team = box["teams"]
+            is_saints_home = home_team and "New Orleans" in home_team
+            opponent = away_team if is_saints_home else home_team
+            home_away = "home" if is_saints_home else "away"
+
+            away_score = box["metadata"].get("away_score")
+            home_score = box["metadata"].get("home_score")
+            saints_score = home_score if is_saints_home else away_score
+            opp_score = away_score if is_saints_home else home_score
+
+            result = None
+            if saints_score is not None and opp_score is not None:
+                if saints_score > opp_score:
+                    result = "W"
+                elif saints_score < opp_score:
+                    result = "L"
+                else:
+                    result = "T"
+
+            game_record = {
+                "game_id": game_id,
+                "season": year,
+                "game_date": game["game_date"],
+                "day_of_week": None,
+                "game_type": game["game_type"],
+                "opponent": opponent or "Unknown",
+                "opponent_abbr": None,
+                "home_away": home_away,
+                "saints_score": saints_score,
+                "opponent_score": opp_score,
+                "result": result,
+                "location": None,
+                "venue": None,
+                "attendance": None,
+                "boxscore_url": boxscore_url,
+            }
+            upsert_game(conn, game_record)
+
+            _insert_boxscore(conn, game_id, box, force=force)
+            boxscore_count += 1
+            if boxscore_count % COMMIT_EVERY == 0:
+                conn.commit()
+
+            print(f"  [{i}/{total}] {game_id}: {game['game_date']} vs {opponent or '?'} "
+                  f"({saints_score}-{opp_score} {result})")
+
+    # Only trust a future 304 once every box score on this page is stored
+    if not errors:
+        save_page_validators(conn, url, validators)
+        conn.commit()
 
     print(f"\n  Season {year} complete: {boxscore_count} scraped, "
           f"{skipped} skipped, {errors} errors")
@@ -240,15 +486,22 @@ def scrape_footballdb_season(session, conn, year: int, force: bool = False) -> d
     }
 
 
-def scrape_season(session, conn, year: int, force: bool = False) -> dict:
+def scrape_season(session, conn, year: int, force: bool = False,
+                  refresh: bool = False) -> dict:
     """Scrape a single season. Returns a summary dict."""
     print(f"\n{'='*60}")
     print(f"Season {year}")
     print(f"{'='*60}")
 
+    # Past seasons are final, so their pages can be served from cache forever
+    immutable = year < current_season()
+
     # Fetch season page
     url = season_url(year)
-    html = fetch(session, url)
+    validators = {} if force or refresh else get_page_validators(conn, url)
+    html, validators = fetch_conditional(session, url, validators, immutable, refresh)
+    if html is NOT_MODIFIED:
+        return _unchanged_season(conn, year)
     if html is None:
         print(f"  SKIP: could not fetch season page for {year}")
         return {"season": year, "games": 0, "boxscores": 0, "skipped": 0, "errors": 0}
@@ -264,39 +517,54 @@ def scrape_season(session, conn, year: int, force: bool = False) -> dict:
 
     # Scrape box scores
     boxscore_count = 0
-    skipped = 0
     errors = 0
 
     games_with_boxscores = [g for g in games if g["boxscore_url"]]
     total = len(games_with_boxscores)
 
-    for i, game in enumerate(games_with_boxscores, 1):
-        game_id = game["game_id"]
-        boxscore_url = game["boxscore_url"]
-
-        # Skip if already scraped (unless --force)
-        if not force and game_exists(conn, game_id):
-            skipped += 1
-            continue
-
-        # Rate limit
-        time.sleep(REQUEST_DELAY)
-
-        # Fetch box score
-        box_html = fetch(session, boxscore_url)
-        if box_html is None:
-            errors += 1
-            print(f"  [{i}/{total}] ERROR: {game_id}")
-            continue
-
-        # Parse
-        box = parse_boxscore(box_html, game_id)
-
-        _insert_boxscore(conn, game_id, box, force=force)
-        boxscore_count += 1
-
-        print(f"  [{i}/{total}] {game_id}: {game['game_date']} vs {game['opponent']} "
-              f"({game['saints_score']}-{game['opponent_score']} {game['result']})")
+    # Skip games already scraped (unless --force), with one query per season
+    done = set() if force else scraped_game_ids(
+        conn, [g["game_id"] for g in games_with_boxscores])
+    pending = [(i, game) for i, game in enumerate(games_with_boxscores, 1)
+               if game["game_id"] not in done]
+    skipped = total - len(pending)
+    if not pending:
+        print(f"\n  Season {year}: all {total} box scores already scraped")
+        save_page_validators(conn, url, validators)
+        conn.commit()
+        return {"season": year, "games": len(games), "boxscores": 0,
+                "skipped": skipped, "errors": 0}
+
+    # Fetch box scores concurrently; parse and write each to the DB in order
+    # on this thread as it arrives
+    box_htmls = fetch_many(session, [game["boxscore_url"] for _, game in pending],
+                           immutable, refresh)
+
+    # One transaction per season (rolled back on error), with periodic checkpoints
+    with conn:
+        for (i, game), box_html in zip(pending, box_htmls):
+            game_id = game["game_id"]
+
+            if box_html is None:
+                errors += 1
+                print(f"  [{i}/{total}] ERROR: {game_id}")
+                continue
+
+            # Parse
+            box = parse_boxscore(box_html, game_id)
+
+            _insert_boxscore(conn, game_id, box, force=force)
+            boxscore_count += 1
+            if boxscore_count % COMMIT_EVERY == 0:
+                conn.commit()
+
+            print(f"  [{i}/{total}] {game_id}: {game['game_date']} vs {game['opponent']} "
+                  f"({game['saints_score']}-{game['opponent_score']} {game['result']})")
+
+    # Only trust a future 304 once every box score on this page is stored
+    if not errors:
+        save_page_validators(conn, url, validators)
+        conn.commit()
 
     print(f"\n  Season {year} complete: {boxscore_count} scraped, "
           f"{skipped} skipped, {errors} errors")
@@ -336,6 +604,8 @@ def parse_args():
                         help="End year (default: current season)")
     parser.add_argument("--force", action="store_true",
                         help="Re-scrape even if data exists")
+    parser.add_argument("--refresh", action="store_true",
+                        help="Drop cached pages for the seasons being scraped and re-download them")
     parser.add_argument("--db", type=str, default=DB_PATH,
                         help=f"Database path (default: {DB_PATH})")
     parser.add_argument("--output-dir", type=str, default=OUTPUT_DIR,
@@ -354,10 +624,15 @@ def main():
     conn = init_db(db_path)
     print(f"Database: {os.path.abspath(db_path)}")
 
+    # Past-season pages are cached forever, so a forced re-scrape has to
+    # re-download them too or it would only re-parse the cached copies
+    refresh = args.refresh or args.force
+
     if args.footballdb:
         # FootballDB scrape for a specific season
-        session = make_session(footballdb=True)
-        summary = scrape_footballdb_season(session, conn, args.footballdb, force=args.force)
+        session = get_session(footballdb=True)
+        summary = scrape_footballdb_season(session, conn, args.footballdb,
+                                           force=args.force, refresh=refresh)
         print(f"\nBox scores scraped: {summary['boxscores']}, "
               f"Skipped: {summary['skipped']}, Errors: {summary['errors']}")
 
@@ -378,11 +653,12 @@ def main():
         print(f"Scraping seasons {start_year} to {end_year}")
         print(f"Force re-scrape: {args.force}")
 
-        session = make_session()
+        session = get_session()
         summaries = []
 
         for year in range(start_year, end_year + 1):
-            summary = scrape_season(session, conn, year, force=args.force)
+            summary = scrape_season(session, conn, year, force=args.force,
+                                    refresh=refresh)
             summaries.append(summary)
 
         # Print overall summary
@@ -410,6 +686,7 @@ def main():
     export_json(db_path, output_dir)
     print("JSON export complete.")
 
+    close_sessions()
     conn.close()
 
 
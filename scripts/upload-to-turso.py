@@ -12,14 +12,42 @@ Usage:
 
 import sqlite3
 import argparse
+import itertools
 import os
+import re
 import sys
-import json
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from urllib.request import urlopen, Request
-from urllib.error import HTTPError
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 DB_PATH = Path(__file__).parent.parent / "scraper" / "saints_encyclopedia.db"
+BATCH_SIZE = 200        # statements per pipeline request
+INSERT_BATCH_SIZE = 10  # multi-row INSERTs per pipeline request (~5000 rows)
+ROWS_PER_INSERT = 500   # rows folded into one INSERT ... VALUES (...), (...)
+MAX_IN_FLIGHT = 8       # pipelines posted concurrently
+
+_INSERT_RE = re.compile(r'INSERT INTO ("[^"]+") VALUES')
+
+# Transient failures (rate limits, gateway errors, dropped connections) are
+# retried with exponential backoff; if they persist the upload is aborted.
+# POST is not retried by default, so it is opted in explicitly.
+_RETRY = Retry(
+    total=5,
+    backoff_factor=1,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=frozenset({"POST"}),
+    raise_on_status=False,
+)
+
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_maxsize=16, max_retries=_RETRY))
+
+
+class StatementError(RuntimeError):
+    """One or more statements in a pipeline failed."""
 
 
 def turso_execute(url: str, token: str, statements: list[dict]) -> dict:
@@ -30,27 +58,92 @@ def turso_execute(url: str, token: str, statements: list[dict]) -> dict:
         http_url = f"https://{http_url}"
     endpoint = f"{http_url}/v3/pipeline"
 
-    body = json.dumps({
+    body = {
         "requests": [
             {"type": "execute", "stmt": {"sql": s["sql"]}} for s in statements
         ] + [{"type": "close"}]
-    }).encode()
+    }
 
-    req = Request(
+    resp = _session.post(
         endpoint,
-        data=body,
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-        },
+        json=body,
+        headers={"Authorization": f"Bearer {token}"},
+        timeout=60,
     )
-
+    if not resp.ok:
+        raise RuntimeError(f"HTTP {resp.status_code}: {resp.text[:500]}")
+    result = resp.json()
+    # Failed statements come back as error entries in a 200 response
+    failed = [r.get("error", {}).get("message", "unknown error")
+              for r in result.get("results", []) if r.get("type") == "error"]
+    if failed:
+        raise StatementError("; ".join(failed))
+    return result
+
+
+def upload_batch(url: str, token: str, batch: list[dict]) -> tuple[int, list[str]]:
+    """Execute a batch, bisecting on failure to isolate the bad statements.
+
+    Returns (statements attempted, error messages). "already exists" errors
+    are expected on re-uploads and are not reported. Only statement errors
+    are bisected; HTTP and connection failures (already retried by the
+    session) propagate, since splitting the batch would not fix them.
+    """
     try:
-        with urlopen(req) as resp:
-            return json.loads(resp.read())
-    except HTTPError as e:
-        error_body = e.read().decode() if e.fp else ""
-        raise RuntimeError(f"HTTP {e.code}: {error_body[:500]}") from e
+        turso_execute(url, token, batch)
+        return len(batch), []
+    except StatementError as e:
+        if len(batch) == 1:
+            msg = str(e)
+            return 1, [] if "already exists" in msg else [msg]
+    mid = len(batch) // 2
+    done_a, errors_a = upload_batch(url, token, batch[:mid])
+    done_b, errors_b = upload_batch(url, token, batch[mid:])
+    return done_a + done_b, errors_a + errors_b
+
+
+def batched(iterable, n: int):
+    """Yield lists of up to n items without materializing the iterable."""
+    it = iter(iterable)
+    while chunk := list(itertools.islice(it, n)):
+        yield chunk
+
+
+def dump_statements(conn: sqlite3.Connection):
+    """Stream the database dump as pipeline statements, minus BEGIN/COMMIT."""
+    for line in conn.iterdump():
+        if line.startswith(("BEGIN", "COMMIT")):
+            continue
+        yield {"sql": line}
+
+
+def coalesce_inserts(statements, rows_per_insert: int = ROWS_PER_INSERT):
+    """Fold runs of single-row INSERTs into the same table into multi-row INSERTs.
+
+    iterdump() emits one `INSERT INTO "t" VALUES(...);` per row; Turso bills
+    and round-trips per statement, so up to rows_per_insert rows are sent as
+    one statement. Everything else passes through unchanged and in order.
+
+    A multi-row INSERT is all-or-nothing, so one row the target already has
+    would drop the whole chunk; folded statements use INSERT OR IGNORE so
+    only the duplicates are skipped, as they were when each row was its own
+    statement.
+    """
+    run_table, run_values = None, []
+    for stmt in statements:
+        sql = stmt["sql"]
+        match = _INSERT_RE.match(sql)
+        table = match.group(1) if match else None
+        if run_values and (table != run_table or len(run_values) >= rows_per_insert):
+            yield {"sql": f"INSERT OR IGNORE INTO {run_table} VALUES{','.join(run_values)};"}
+            run_values = []
+        if table is None:
+            yield stmt
+            continue
+        run_table = table
+        run_values.append(sql[match.end():].removesuffix(";"))
+    if run_values:
+        yield {"sql": f"INSERT OR IGNORE INTO {run_table} VALUES{','.join(run_values)};"}
 
 
 def main():
@@ -73,43 +166,54 @@ def main():
     print(f"Source DB: {db_path}")
     print(f"Target:    {args.url}")
 
-    # Dump the database
+    # Execute in batches as the dump is produced. Runs of INSERTs go out
+    # concurrently; everything else (CREATE TABLE/INDEX, DELETE) runs in
+    # order between them, so rows never race ahead of their table. Only a
+    # bounded window of batches is held in memory at once.
     conn = sqlite3.connect(str(db_path))
-    statements = []
-    for line in conn.iterdump():
-        if line.startswith("BEGIN") or line.startswith("COMMIT"):
-            continue
-        statements.append({"sql": line})
-    conn.close()
-
-    print(f"Total statements: {len(statements)}")
-
-    # Execute in batches
-    BATCH_SIZE = 50
     executed = 0
     errors = 0
+    batches_sent = 0
+
+    def record(done: int, messages: list[str]) -> None:
+        nonlocal executed, errors, batches_sent
+        executed += done
+        batches_sent += 1
+        for msg in messages:
+            errors += 1
+            if errors <= 5:
+                print(f"\n  Error: {msg[:150]}")
+        print(f"\r  Progress: {batches_sent} batches, {executed} statements - {errors} errors", end="", flush=True)
 
-    for i in range(0, len(statements), BATCH_SIZE):
-        batch = statements[i : i + BATCH_SIZE]
-        try:
-            turso_execute(args.url, args.token, batch)
-            executed += len(batch)
-        except Exception as e:
-            # Try one by one on failure
-            for stmt in batch:
-                try:
-                    turso_execute(args.url, args.token, [stmt])
-                    executed += 1
-                except Exception as inner_e:
-                    msg = str(inner_e)
-                    if "already exists" not in msg:
-                        errors += 1
-                        if errors <= 5:
-                            print(f"\n  Error: {msg[:150]}")
-                    executed += 1
-
-        pct = (executed / len(statements)) * 100
-        print(f"\r  Progress: {executed}/{len(statements)} ({pct:.0f}%) - {errors} errors", end="", flush=True)
+    try:
+        with ThreadPoolExecutor(max_workers=MAX_IN_FLIGHT) as pool:
+            try:
+                for is_insert, group in itertools.groupby(
+                    coalesce_inserts(dump_statements(conn)),
+                    key=lambda s: s["sql"].startswith("INSERT"),
+                ):
+                    if not is_insert:
+                        for batch in batched(group, BATCH_SIZE):
+                            record(*upload_batch(args.url, args.token, batch))
+                        continue
+                    pending = set()
+                    for batch in batched(group, INSERT_BATCH_SIZE):
+                        if len(pending) >= 2 * MAX_IN_FLIGHT:
+                            finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                            for future in finished:
+                                record(*future.result())
+                        pending.add(pool.submit(upload_batch, args.url, args.token, batch))
+                    for future in wait(pending).done:
+                        record(*future.result())
+            except BaseException:
+                # Don't start queued batches once the upload is failing
+                pool.shutdown(cancel_futures=True)
+                raise
+    except (requests.RequestException, RuntimeError) as e:
+        print(f"\n\nUpload aborted: {e}")
+        sys.exit(1)
+    finally:
+        conn.close()
 
     print(f"\n\nDone! {executed} statements, {errors} errors.")
 